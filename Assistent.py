@@ -2,12 +2,13 @@
 Voice-Activated Personal Assistant (single-file)
 
 Features:
-- Wake-word (simple): say "assistant" or press Enter to start listening
-- Speech recognition (speech_recognition library using Google Web Speech by default)
+- Wake-word: say "hey jarvis" (detected offline with openWakeWord) or press Enter to start listening
+- Speech recognition on-device with faster-whisper, falling back to Google Web Speech (speech_recognition library)
 - Text-to-speech using pyttsx3 (offline)
 - Set reminders (schedules a local reminder)
 - Check weather (OpenWeatherMap API) — requires API key
 - Read top news headlines (NewsAPI) — requires API key
+- Combined briefing: say "briefing" or ask for weather and news together
 - Tell the time / date
 - Basic conversation and fallback to web search (opens browser)
 
@@ -18,8 +19,12 @@ Setup:
    .\.venv\Scripts\activate   # Windows (PowerShell: .\.venv\Scripts\Activate.ps1)
 
 2. Install dependencies:
-   pip install SpeechRecognition pyttsx3 requests pyaudio
+   pip install SpeechRecognition pyttsx3 requests cachetools pyaudio
    # On Windows, installing pyaudio may require wheels; on Linux, `sudo apt-get install portaudio19-dev` then pip install pyaudio.
+   pip install openwakeword   # optional: offline wake word; without it, press Enter to speak
+   python -c "import openwakeword.utils; openwakeword.utils.download_models()"
+   pip install simpleaudio   # optional: play pre-rendered audio for fixed phrases
+   pip install faster-whisper   # optional: offline speech recognition instead of Google Web Speech
 
 3. Get API keys (optional but required for weather/news):
    - OpenWeatherMap: https://openweathermap.org/api -> set OPENWEATHER_API_KEY
@@ -29,59 +34,390 @@ Setup:
    python voice_assistant.py
 
 Notes:
-- This script uses the Google Web Speech API by default via `speech_recognition`. That requires internet. You may switch to an offline recognizer (pocketsphinx) but need extra setup.
+- Without faster-whisper the script uses the Google Web Speech API via `speech_recognition`. That requires internet.
 - pyttsx3 is offline for TTS.
 
 """
 
 import os
+import re
+import atexit
 import time
+import wave
+import hashlib
+import tempfile
+import itertools
+import queue
 import threading
 import webbrowser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import speech_recognition as sr
 import pyttsx3
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import openwakeword
+except ImportError:
+    openwakeword = None
+try:
+    import simpleaudio
+except ImportError:
+    simpleaudio = None
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
 # -------------------- Configuration --------------------
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY", "")
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY", "")
 DEFAULT_CITY = "New Delhi,IN"
-WAKE_WORDS = ("assistant", "hey assistant", "ok assistant")
+WAKE_WORD_MODEL = "hey_jarvis"
+WAKE_THRESHOLD = 0.5
+AUDIO_RATE = 16000       # Hz, mono 16-bit
+AUDIO_CHUNK = 1280       # frames per microphone read (80 ms, what openWakeWord expects)
+PREROLL_SECONDS = 2.0    # audio kept from before listen() is called
+ASR_MODEL = "tiny.en"    # faster-whisper model used for offline recognition
+ASR_COMPUTE_TYPE = "int8"  # CTranslate2 quantization; int8 is several times faster than float32 on CPU
+CACHE_TTL = {"weather": 600, "news": 300}  # seconds an API response is reused
+TTS_CACHE_DIR = os.path.join(tempfile.gettempdir(), "assistant_tts")
+CANNED_PHRASES = (
+    "Yes?",
+    "Listening for your command.",
+    "Hello! How can I help you?",
+    "I did not hear anything.",
+    "I didn't catch that. Please repeat.",
+    "Checking the headlines.",
+    "You are welcome!",
+    "Goodbye!",
+)
 
 # -------------------- TTS Engine --------------------
 engine = pyttsx3.init()
 engine.setProperty('rate', 160)
 engine.setProperty('volume', 1.0)
 
-def speak(text: str):
-    """Speak given text (non-blocking)."""
-    def _run(t):
-        engine.say(t)
-        engine.runAndWait()
-    t = threading.Thread(target=_run, args=(text,))
-    t.daemon = True
-    t.start()
+tts_queue = queue.Queue()  # (seq, text, interruptible) in the order they should be spoken
+_tts_seq = itertools.count(1)
+tts_cutoff = 0  # interruptible utterances numbered below this were cancelled by stop_speaking()
+tts_speaking = threading.Event()   # set while audio is playing, so we don't wake ourselves
+CANNED = {}  # normalized phrase -> pre-rendered WAV path
+
+def _phrase_key(text: str) -> str:
+    return text.lower().strip()
+
+def _wav_path(text: str) -> str:
+    # Voice and rate are part of the key so a settings change re-renders the audio.
+    key = f"{engine.getProperty('voice')}|{engine.getProperty('rate')}|{_phrase_key(text)}"
+    name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(TTS_CACHE_DIR, name + ".wav")
+
+def _valid_wav(path: str) -> bool:
+    """True if path is a readable, non-empty WAV file."""
+    try:
+        with wave.open(path, "rb") as w:
+            return w.getnframes() > 0
+    except (OSError, EOFError, wave.Error):
+        return False
+
+def prerender_phrases(phrases=CANNED_PHRASES):
+    """Synthesize fixed phrases to WAV files once, so they can just be played."""
+    if simpleaudio is None:
+        return
+    os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+    for text in phrases:
+        path = _wav_path(text)
+        if not _valid_wav(path):  # also redoes files cut short by an earlier crash
+            engine.save_to_file(text, path)
+    engine.runAndWait()
+    for text in phrases:
+        path = _wav_path(text)
+        if _valid_wav(path):
+            CANNED[_phrase_key(text)] = path
+
+def _pump(cancelled, playback=None):
+    """Iterate the engine until it (or a WAV playback) finishes or cancelled() is true."""
+    while playback.is_playing() if playback else engine.isBusy():
+        if cancelled():
+            if playback:
+                playback.stop()
+            else:
+                engine.stop()
+        engine.iterate()
+        time.sleep(0.01)
+
+def _synthesize(text: str, cancelled):
+    path = CANNED.get(_phrase_key(text))
+    if path:
+        try:
+            playback = simpleaudio.WaveObject.from_wave_file(path).play()
+        except Exception as e:
+            # Don't keep a broken file around; synthesize this and later calls instead.
+            print("Could not play cached audio, synthesizing instead:", e)
+            CANNED.pop(_phrase_key(text), None)
+        else:
+            _pump(cancelled, playback)
+            return
+    engine.say(text)
+    _pump(cancelled)
+
+def tts_worker():
+    """Own the pyttsx3 engine (it is not thread-safe) and speak queued text in order.
+
+    After pre-rendering, the engine runs in external-loop mode and is driven
+    with iterate(), so an utterance can be cut short by stop_speaking()
+    instead of blocking in runAndWait() until it ends.
+    """
+    try:
+        prerender_phrases()
+    except Exception as e:
+        print("Warning: Could not pre-render phrases:", e)
+    try:
+        engine.startLoop(False)
+        tts_ready = True
+    except Exception as e:
+        # Keep draining the queue so nothing waiting on speech hangs.
+        print("Warning: Text-to-speech unavailable, printing replies instead:", e)
+        tts_ready = False
+    while True:
+        seq, text, interruptible = tts_queue.get()
+        def cancelled():
+            return interruptible and seq < tts_cutoff
+        if cancelled():
+            tts_queue.task_done()
+            continue
+        tts_speaking.set()
+        try:
+            if tts_ready:
+                _synthesize(text, cancelled)
+            else:
+                print("Assistant:", text)
+        except Exception as e:
+            print("Text-to-speech error:", e)
+        finally:
+            tts_speaking.clear()
+            tts_queue.task_done()
+
+threading.Thread(target=tts_worker, daemon=True).start()
+
+def speak(text: str, interruptible: bool = True):
+    """Speak given text (non-blocking). Pre-rendered phrases are played straight from disk.
+
+    Pass interruptible=False for speech that stop_speaking() must not cancel.
+    """
+    tts_queue.put((next(_tts_seq), text, interruptible))
+
+def wait_until_spoken(timeout: float) -> bool:
+    """Wait for queued speech to finish; False if it is still going after timeout.
+
+    Polls instead of tts_queue.join() so it can't hang and Ctrl+C still works.
+    """
+    deadline = time.monotonic() + timeout
+    while tts_queue.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+def stop_speaking():
+    """Cancel everything queued or being said so far, except non-interruptible speech.
+
+    Only an Enter press can trigger this mid-speech: wake-word scoring is
+    paused while the assistant is talking, so it can't wake itself up.
+    """
+    global tts_cutoff
+    # Comparing sequence numbers instead of toggling a flag means a stop can't
+    # be lost between the worker taking an item and starting to speak it.
+    tts_cutoff = next(_tts_seq)
 
 # -------------------- Speech Recognition --------------------
 recognizer = sr.Recognizer()
+# Let the threshold follow the room after the initial calibration, and end
+# phrases sooner than the default 0.8 s of trailing silence.
+recognizer.dynamic_energy_threshold = True
+recognizer.pause_threshold = 0.5
+listen_lock = threading.Lock()  # one reader on the microphone at a time
+
+class RingStream:
+    """Ring buffer of captured audio chunks, read like a PyAudio stream."""
+
+    def __init__(self, seconds: float):
+        self.frames = deque(maxlen=max(1, int(seconds * AUDIO_RATE / AUDIO_CHUNK)))
+        self.ready = threading.Condition()
+        self.closed = False
+
+    def push(self, data: bytes):
+        with self.ready:
+            self.frames.append(data)
+            self.ready.notify()
+
+    def close(self):
+        with self.ready:
+            self.closed = True
+            self.ready.notify_all()
+
+    def clear(self):
+        with self.ready:
+            self.frames.clear()
+
+    def buffered_seconds(self) -> float:
+        with self.ready:
+            return len(self.frames) * AUDIO_CHUNK / AUDIO_RATE
+
+    def read(self, size: int) -> bytes:
+        with self.ready:
+            while not self.frames and not self.closed:
+                self.ready.wait()
+            return self.frames.popleft() if self.frames else b""
+
+class BufferedSource(sr.AudioSource):
+    """AudioSource fed from the capture thread, so `recognizer.listen` sees pre-roll audio."""
+
+    def __init__(self, stream: RingStream, sample_width: int):
+        self.stream = stream
+        self.SAMPLE_RATE = AUDIO_RATE
+        self.SAMPLE_WIDTH = sample_width
+        self.CHUNK = AUDIO_CHUNK
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
 mic = None
+mic_source = None
+audio_ring = RingStream(PREROLL_SECONDS)
+buffered_source = None
 try:
-    mic = sr.Microphone()
+    mic = sr.Microphone(sample_rate=AUDIO_RATE, chunk_size=AUDIO_CHUNK)
+    # Open the stream once and calibrate a single time instead of on every listen.
+    mic_source = mic.__enter__()
+    recognizer.adjust_for_ambient_noise(mic_source, duration=0.8)
+    buffered_source = BufferedSource(audio_ring, mic_source.SAMPLE_WIDTH)
 except Exception as e:
     print("Warning: Could not initialize microphone:", e)
+    mic = mic_source = None
+
+wake_model = None
+if openwakeword is None:
+    print("Note: openwakeword is not installed; press Enter to speak.")
+else:
+    try:
+        wake_model = openwakeword.Model(wakeword_models=[WAKE_WORD_MODEL])
+    except Exception as e:
+        print("Warning: Could not load wake-word model:", e)
+
+triggers = queue.Queue()  # "wake" or "enter", consumed by main_loop
+capture_stop = threading.Event()
+capture_thread = None
 
-def listen(timeout: int = 5, phrase_time_limit: int = 8) -> str:
-    """Listen from microphone and return recognized text (lowercased)."""
-    if mic is None:
+def capture_worker():
+    """Keep reading the microphone so audio is already buffered when listen() starts.
+
+    Each chunk is also scored by the local wake-word model, so nothing is sent
+    over the network until the wake word has been heard.
+    """
+    while not capture_stop.is_set():
+        try:
+            data = mic_source.stream.read(mic_source.CHUNK)
+        except Exception as e:
+            print("Microphone capture stopped:", e)
+            break
+        # Our own voice is neither buffered as command audio nor scored for the
+        # wake word; a listen() in progress simply waits until speech ends.
+        if tts_speaking.is_set():
+            continue
+        audio_ring.push(data)
+        # Don't look for the wake word while a command is being recorded.
+        if wake_model is None or listen_lock.locked():
+            continue
+        scores = wake_model.predict(np.frombuffer(data, dtype=np.int16))
+        if max(scores.values(), default=0) > WAKE_THRESHOLD:
+            wake_model.reset()
+            audio_ring.clear()  # keep the wake word out of the command audio
+            triggers.put("wake")
+    audio_ring.close()
+
+def close_microphone():
+    """Stop the capture thread, then release the stream opened at startup."""
+    capture_stop.set()
+    capture_thread.join(timeout=1)
+    mic.__exit__(None, None, None)
+
+if mic_source is not None:
+    # The stream stays open for the whole session; it is only closed at exit.
+    capture_thread = threading.Thread(target=capture_worker, daemon=True)
+    capture_thread.start()
+    atexit.register(close_microphone)
+
+asr_model = None
+if WhisperModel is not None:
+    try:
+        asr_model = WhisperModel(ASR_MODEL, device="cpu", compute_type=ASR_COMPUTE_TYPE)
+    except Exception as e:
+        print("Warning: Could not load Whisper model, using Google Web Speech:", e)
+
+_PUNCT_RE = re.compile(r"[^\w\s']")
+
+def transcribe_local(audio: sr.AudioData, speculate: bool = False) -> str:
+    """Recognize audio on-device with Whisper.
+
+    With speculate=True, the text decoded so far is handed to prefetch()
+    whenever another segment follows, so the HTTP call overlaps the
+    decoding of the rest. A single-segment command gets no head start.
+    """
+    raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    # Greedy decoding, and let the VAD skip silent stretches instead of decoding them.
+    segments, _ = asr_model.transcribe(samples, language="en", beam_size=1, vad_filter=True)
+    text = ""
+    for segment in segments:  # decoded lazily, one segment at a time
+        if speculate and text:
+            prefetch(text)
+        # Whisper punctuates; the command parser (and prefetch keys) expect bare words.
+        text += _PUNCT_RE.sub(" ", segment.text)
+    return text.strip()
+
+def transcribe_google(audio: sr.AudioData) -> str:
+    """Recognize audio with the Google Web Speech API."""
+    return recognizer.recognize_google(audio)
+
+def listen(timeout: int = 5, phrase_time_limit: int = 8, speculate: bool = False) -> str:
+    """Listen from microphone and return recognized text (lowercased).
+
+    speculate=True lets partial results start weather/news requests early;
+    only top-level commands use it, not follow-up answers.
+    """
+    if buffered_source is None:
         return ""
-    with mic as source:
-        recognizer.adjust_for_ambient_noise(source, duration=0.5)
-        print("Listening...")
-        audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
     try:
-        text = recognizer.recognize_google(audio)
+        prefetched.clear()  # speculation from the previous utterance is stale now
+        with listen_lock:
+            print("Listening...")
+            # The pre-roll is consumed instantly, so don't let it eat into the timeout.
+            timeout += audio_ring.buffered_seconds()
+            audio = recognizer.listen(buffered_source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+        if asr_model is not None:
+            try:
+                text = transcribe_local(audio, speculate)
+            except Exception as e:
+                print("Local speech recognition error:", e)
+                return ""
+        else:
+            text = transcribe_google(audio)
+        if not text:
+            return ""
         print("Heard:", text)
         return text.lower()
     except sr.WaitTimeoutError:
@@ -93,44 +429,69 @@ def listen(timeout: int = 5, phrase_time_limit: int = 8) -> str:
         return ""
 
 # -------------------- Reminders --------------------
-reminders = []  # list of (datetime, message)
-reminder_lock = threading.Lock()
+reminders = queue.PriorityQueue()  # (datetime, id, message), earliest first
+_reminder_ids = itertools.count()  # tie-breaker so equal times never compare messages
 
 def reminder_worker():
+    """Sleep until the earliest reminder is due (or a new one is added), then announce it."""
     while True:
-        now = datetime.now()
-        with reminder_lock:
-            due = [r for r in reminders if r[0] <= now]
-            reminders[:] = [r for r in reminders if r[0] > now]
-        for when, msg in due:
-            speak(f"Reminder: {msg}")
-            print(f"[Reminder at {when}]: {msg}")
-        time.sleep(1)
+        item = reminders.get()
+        delay = (item[0] - datetime.now()).total_seconds()
+        if delay > 0:
+            try:
+                newer = reminders.get(timeout=delay)
+            except queue.Empty:
+                pass
+            else:
+                # Something was added meanwhile; requeue both and start over with the earliest.
+                reminders.put(item)
+                reminders.put(newer)
+                continue
+        when, _, msg = item
+        speak(f"Reminder: {msg}", interruptible=False)
+        print(f"[Reminder at {when}]: {msg}")
 
 threading.Thread(target=reminder_worker, daemon=True).start()
 
 def set_reminder_in(minutes: int, message: str):
     when = datetime.now() + timedelta(minutes=minutes)
-    with reminder_lock:
-        reminders.append((when, message))
+    reminders.put((when, next(_reminder_ids), message))
     speak(f"Okay. I will remind you in {minutes} minutes about {message}.")
     print(f"Set reminder at {when} -> {message}")
 
+# -------------------- HTTP --------------------
+# One pooled session so repeat weather/news calls reuse the open TLS connection.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                      max_retries=Retry(total=2, backoff_factor=0.2)))
+
+# Successful responses are reused for as long as the upstream data stays current.
+weather_cache = TTLCache(maxsize=32, ttl=CACHE_TTL["weather"])  # city -> (text, None)
+news_cache = TTLCache(maxsize=8, ttl=CACHE_TTL["news"])         # count -> (headlines, None)
+http_cache_lock = threading.Lock()  # the fetch pool calls in from several threads
+
 # -------------------- Weather --------------------
 
 def get_weather(city: str = DEFAULT_CITY):
     if not OPENWEATHER_API_KEY:
         return None, "OpenWeather API key not set. Set OPENWEATHER_API_KEY environment variable."
     url = "https://api.openweathermap.org/data/2.5/weather"
+    key = city.lower()
+    with http_cache_lock:
+        if key in weather_cache:
+            return weather_cache[key]
     params = {"q": city, "appid": OPENWEATHER_API_KEY, "units": "metric"}
     try:
-        r = requests.get(url, params=params, timeout=8)
+        r = SESSION.get(url, params=params, timeout=8)
         r.raise_for_status()
         j = r.json()
         desc = j['weather'][0]['description']
         temp = j['main']['temp']
         feels = j['main'].get('feels_like')
-        return f"{desc}, temperature {temp}°C, feels like {feels}°C", None
+        result = f"{desc}, temperature {temp}°C, feels like {feels}°C", None
+        with http_cache_lock:
+            weather_cache[key] = result
+        return result
     except Exception as e:
         return None, str(e)
 
@@ -140,18 +501,66 @@ def get_top_news(count: int = 5):
     if not NEWSAPI_KEY:
         return None, "NewsAPI key not set. Set NEWSAPI_KEY environment variable."
     url = "https://newsapi.org/v2/top-headlines"
+    with http_cache_lock:
+        if count in news_cache:
+            return news_cache[count]
     params = {"apiKey": NEWSAPI_KEY, "country": "in", "pageSize": count}
     try:
-        r = requests.get(url, params=params, timeout=8)
+        r = SESSION.get(url, params=params, timeout=8)
         r.raise_for_status()
         j = r.json()
         articles = j.get('articles', [])
         headlines = [a['title'] for a in articles]
+        if headlines:
+            with http_cache_lock:
+                news_cache[count] = headlines, None
         return headlines, None
     except Exception as e:
         return None, str(e)
 
+# -------------------- Prefetch --------------------
+fetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fetch")
+prefetched = {}  # (intent, argument) -> Future of the fetch result
+
+def extract_city(text: str) -> str:
+    """Return the words after "in" as the city, or DEFAULT_CITY.
+
+    A trailing "and (the) news/headlines" from a briefing request is dropped,
+    but an "and" inside a name ("trinidad and tobago") is kept.
+    """
+    parts = text.split()
+    if 'in' in parts:
+        rest = parts[parts.index('in') + 1:]
+        news_at = next((i for i, w in enumerate(rest) if w in ('news', 'headlines')), None)
+        if news_at is not None and 'and' in rest[:news_at]:
+            rest = rest[:news_at - 1 - rest[:news_at][::-1].index('and')]
+        city = ' '.join(rest)
+        if city:
+            return city
+    return DEFAULT_CITY
+
+def prefetch(hypothesis: str):
+    """Speculatively start the HTTP call for a recognition hypothesis."""
+    hypothesis = hypothesis.lower()
+    # A partial ending in "in" hasn't reached the city yet; don't fetch the default one.
+    if 'weather' in hypothesis and hypothesis.split()[-1] != 'in':
+        key = ("weather", extract_city(hypothesis))
+        if key not in prefetched:
+            prefetched[key] = fetch_pool.submit(get_weather, key[1])
+    if 'news' in hypothesis or 'headlines' in hypothesis:
+        key = ("news", 5)
+        if key not in prefetched:
+            prefetched[key] = fetch_pool.submit(get_top_news, key[1])
+
+def fetch(intent: str, func, arg):
+    """Return a Future of func(arg), reusing a matching prefetch if there is one."""
+    future = prefetched.pop((intent, arg), None)
+    if future is None:
+        future = fetch_pool.submit(func, arg)
+    return future
+
 # -------------------- Command Handling --------------------
+_REMIND_RE = re.compile(r"remind me in (\d+) (minute|minutes|hour|hours) (?:to )?(.*)")
 
 def handle_command(text: str):
     text = text.lower().strip()
@@ -162,8 +571,7 @@ def handle_command(text: str):
     # Reminders
     if "remind me in" in text:
         # e.g. "remind me in 10 minutes to check the oven"
-        import re
-        m = re.search(r"remind me in (\d+) (minute|minutes|hour|hours) (?:to )?(.*)", text)
+        m = _REMIND_RE.search(text)
         if m:
             value = int(m.group(1))
             unit = m.group(2)
@@ -193,108 +601,146 @@ def handle_command(text: str):
             speak("I couldn't parse the time. Reminder cancelled.")
         return
 
-    # Weather
-    if 'weather' in text:
-        # optional: extract city
-        parts = text.split()
-        city = DEFAULT_CITY
-        # naive city extraction
-        if 'in' in parts:
-            try:
-                idx = parts.index('in')
-                city = ' '.join(parts[idx+1:])
-            except Exception:
-                city = DEFAULT_CITY
-        weather_text, err = get_weather(city)
-        if err:
-            speak(f"Sorry, I couldn't fetch weather. {err}")
-        else:
-            speak(f"Weather in {city}: {weather_text}")
-        return
-
-    # News
-    if 'news' in text or 'headlines' in text:
-        headlines, err = get_top_news(5)
-        if err:
-            speak(f"Sorry, can't fetch news: {err}")
-        else:
-            speak("Here are the top headlines.")
-            for h in headlines:
-                speak(h)
-                time.sleep(0.5)
-        return
-
-    # Time and date
-    if 'time' in text:
-        now = datetime.now().strftime('%I:%M %p')
-        speak(f"The time is {now}")
-        return
-    if 'date' in text:
-        today = datetime.now().strftime('%A, %B %d, %Y')
-        speak(f"Today is {today}")
+    # Single pass over the words instead of a substring search per keyword
+    words = set(text.split())
+    if 'briefing' in words or ('weather' in words and ('news' in words or 'headlines' in words)):
+        do_briefing(text)
         return
 
-    # Open website / search
-    if text.startswith('search for') or text.startswith('google') or 'search' in text:
-        # open a web browser search
-        query = text.replace('search for', '').replace('google', '').replace('search', '')
-        query = query.strip()
-        if not query:
-            speak('What should I search for?')
-            query = listen()
-        if query:
-            speak(f"Searching for {query} on the web.")
-            webbrowser.open(f"https://www.google.com/search?q={requests.utils.requote_uri(query)}")
-        return
-
-    # Basic small talk
-    if any(g in text for g in ['hello', 'hi', 'hey']):
-        speak('Hello! How can I help you?')
-        return
-    if 'thank' in text:
-        speak('You are welcome!')
-        return
+    for keyword, handler in HANDLERS.items():
+        if keyword in words:
+            handler(text)
+            return
 
     # fallback
     speak("Sorry, I don't have a built-in action for that. I can search the web if you like. Say 'search' followed by your query.")
 
+def do_weather(text: str):
+    city = extract_city(text)
+    future = fetch("weather", get_weather, city)
+    # Cover the round-trip with a neutral phrase, unless there is nothing to wait for.
+    if OPENWEATHER_API_KEY and not future.done():
+        speak(f"Checking the weather in {city}.")
+    weather_text, err = future.result()
+    if err:
+        speak(f"Sorry, I couldn't fetch weather. {err}")
+    else:
+        speak(f"Weather in {city}: {weather_text}")
+
+def do_news(text: str):
+    future = fetch("news", get_top_news, 5)
+    if NEWSAPI_KEY and not future.done():
+        speak("Checking the headlines.")
+    headlines, err = future.result()
+    if err:
+        speak(f"Sorry, can't fetch news: {err}")
+    elif not headlines:
+        speak("I couldn't find any headlines right now.")
+    else:
+        # One synthesis call for all headlines instead of one per headline.
+        speak("Here are the top headlines. " + ". ".join(
+            f"Headline {i+1}: {h}" for i, h in enumerate(headlines)))
+
+def do_briefing(text: str):
+    # Start both requests before speaking either so the round-trips overlap;
+    # do_weather/do_news then pick up the running futures.
+    city = extract_city(text)
+    for key, func in ((("weather", city), get_weather), (("news", 5), get_top_news)):
+        if key not in prefetched:
+            prefetched[key] = fetch_pool.submit(func, key[1])
+    do_weather(text)
+    do_news(text)
+
+def do_time(text: str):
+    now = datetime.now().strftime('%I:%M %p')
+    speak(f"The time is {now}")
+
+def do_date(text: str):
+    today = datetime.now().strftime('%A, %B %d, %Y')
+    speak(f"Today is {today}")
+
+def do_search(text: str):
+    # open a web browser search
+    query = text.replace('search for', '').replace('google', '').replace('search', '')
+    query = query.strip()
+    if not query:
+        speak('What should I search for?')
+        query = listen()
+    if query:
+        speak(f"Searching for {query} on the web.")
+        webbrowser.open(f"https://www.google.com/search?q={requests.utils.requote_uri(query)}")
+
+def do_greeting(text: str):
+    speak('Hello! How can I help you?')
+
+def do_thanks(text: str):
+    speak('You are welcome!')
+
+# Keyword -> handler, checked in this order; earlier entries take priority.
+HANDLERS = {
+    "weather": do_weather,
+    "news": do_news,
+    "headlines": do_news,
+    "time": do_time,
+    "date": do_date,
+    "search": do_search,
+    "google": do_search,
+    "hello": do_greeting,
+    "hi": do_greeting,
+    "hey": do_greeting,
+    "thank": do_thanks,
+    "thanks": do_thanks,
+}
+
 # -------------------- Main loop --------------------
+_QUIT_RE = re.compile(r"\b(?:quit|exit|stop assistant)\b")
 
-def main_loop():
-    speak('Assistant is starting. Say "assistant" or press Enter to speak.')
-    print('--- Voice Assistant started ---')
+def enter_worker():
+    """Turn each Enter keypress into a trigger for main_loop."""
     while True:
-        # Simple wake-word approach: listen briefly for wake word OR user can press Enter
-        print('\nPress Enter to speak or say the wake word... (say "quit" or "exit" to stop)')
-        # spawn a short listener in background to catch wake word
-        heard = ""
         try:
-            # non-blocking: listen with short timeout to check wake word
-            heard = listen(timeout=3, phrase_time_limit=3)
-        except Exception:
-            heard = ""
+            input()
+        except EOFError:
+            return
+        triggers.put("enter")
 
-        if heard and any(w in heard for w in WAKE_WORDS):
-            speak('Yes?')
-            cmd = listen(timeout=5, phrase_time_limit=10)
-            if cmd:
-                if any(q in cmd for q in ['quit', 'exit', 'stop assistant']):
-                    speak('Goodbye!')
-                    break
-                handle_command(cmd)
-            else:
-                speak('I did not hear anything.')
-            continue
+def wait_for_trigger() -> str:
+    """Block until a wake word or Enter press arrives.
+
+    Polls with a timeout so Ctrl+C is still delivered (an untimed Queue.get
+    can't be interrupted on Windows).
+    """
+    while True:
+        try:
+            return triggers.get(timeout=0.5)
+        except queue.Empty:
+            pass
+
+def drain_triggers():
+    """Discard triggers that arrived while a command was being handled."""
+    while True:
+        try:
+            triggers.get_nowait()
+        except queue.Empty:
+            return
 
-        # allow user to just press Enter to speak
+def main_loop():
+    speak('Assistant is starting. Say the wake word or press Enter to speak.')
+    print('--- Voice Assistant started (wake word: "hey jarvis") ---')
+    threading.Thread(target=enter_worker, daemon=True).start()
+    while True:
+        print('\nPress Enter to speak or say the wake word... (say "quit" or "exit" to stop)')
         try:
-            # wait for a short input — non-blocking with timeout using input()
-            # If user presses Enter quickly, start a full listen
-            _ = input()
-            speak('Listening for your command.')
-            cmd = listen(timeout=6, phrase_time_limit=12)
+            trigger = wait_for_trigger()
+            stop_speaking()  # pressing Enter cuts off e.g. a long headline read
+            if trigger == "wake":
+                speak('Yes?')
+                cmd = listen(timeout=5, phrase_time_limit=10, speculate=True)
+            else:
+                speak('Listening for your command.')
+                cmd = listen(timeout=6, phrase_time_limit=12, speculate=True)
             if cmd:
-                if any(q in cmd for q in ['quit', 'exit', 'stop assistant']):
+                if _QUIT_RE.search(cmd):
                     speak('Goodbye!')
                     break
                 handle_command(cmd)
@@ -303,6 +749,8 @@ def main_loop():
         except KeyboardInterrupt:
             speak('Shutting down. Bye.')
             break
+        drain_triggers()
 
 if __name__ == '__main__':
     main_loop()
+    wait_until_spoken(timeout=10)  # let the goodbye finish before exiting